@@ -15,15 +15,30 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import math
 import unittest.mock
-import warnings
 
 import pytest
 
 import cc1101
+from cc1101.addresses import ConfigurationRegisterAddress
 
 # pylint: disable=protected-access
 
+
+@pytest.fixture(scope="module", name="transceiver")
+def fixture_transceiver():
+    # shared by all tests in this module, which only patch methods
+    # via patch.object (restored on exit) and do not alter other attributes
+    with unittest.mock.patch("spidev.SpiDev"):
+        return cc1101.CC1101()
+
+
+@pytest.fixture(autouse=True)
+def _reset_spi_mock(transceiver):
+    transceiver._spi.reset_mock(return_value=True, side_effect=True)
+
+
 _FREQUENCY_CONTROL_WORD_HERTZ_PARAMS = [
     ([0x10, 0xA7, 0x62], 433000000),
     ([0x10, 0xAB, 0x85], 433420000),
@@ -32,20 +47,16 @@ _FREQUENCY_CONTROL_WORD_HERTZ_PARAMS = [
 ]
 
 
-@pytest.mark.parametrize(
-    ("control_word", "hertz"), _FREQUENCY_CONTROL_WORD_HERTZ_PARAMS
-)
-def test__frequency_control_word_to_hertz(control_word, hertz):
-    assert cc1101.CC1101._frequency_control_word_to_hertz(
-        control_word
-    ) == pytest.approx(hertz, abs=200)
-
-
-@pytest.mark.parametrize(
-    ("control_word", "hertz"), _FREQUENCY_CONTROL_WORD_HERTZ_PARAMS
-)
-def test__hertz_to_frequency_control_word(control_word, hertz):
-    assert cc1101.CC1101._hertz_to_frequency_control_word(hertz) == control_word
+def test__frequency_control_word_hertz_roundtrip():
+    for control_word, hertz in _FREQUENCY_CONTROL_WORD_HERTZ_PARAMS:
+        assert math.isclose(
+            cc1101.CC1101._frequency_control_word_to_hertz(control_word),
+            hertz,
+            abs_tol=200,
+        ), control_word
+        assert (
+            cc1101.CC1101._hertz_to_frequency_control_word(hertz) == control_word
+        ), hertz
 
 
 _FILTER_BANDWIDTH_MANTISSA_EXPONENT_REAL_PARAMS = [
@@ -63,15 +74,24 @@ _FILTER_BANDWIDTH_MANTISSA_EXPONENT_REAL_PARAMS = [
     (3, 2, 116e3),
     (3, 3, 58e3),
 ]
+_FILTER_BANDWIDTH_MANTISSA_EXPONENT_IDS = [
+    f"m{m}e{e}" for m, e, _ in _FILTER_BANDWIDTH_MANTISSA_EXPONENT_REAL_PARAMS
+]
 
 
 @pytest.mark.parametrize(
-    ("mantissa", "exponent", "real"), _FILTER_BANDWIDTH_MANTISSA_EXPONENT_REAL_PARAMS
+    ("mantissa", "exponent", "real"),
+    _FILTER_BANDWIDTH_MANTISSA_EXPONENT_REAL_PARAMS,
+    ids=_FILTER_BANDWIDTH_MANTISSA_EXPONENT_IDS,
 )
 def test__filter_bandwidth_floating_point_to_real(mantissa, exponent, real):
-    assert cc1101.CC1101._filter_bandwidth_floating_point_to_real(
-        mantissa=mantissa, exponent=exponent
-    ) == pytest.approx(real, rel=1e-3)
+    assert math.isclose(
+        cc1101.CC1101._filter_bandwidth_floating_point_to_real(
+            mantissa=mantissa, exponent=exponent
+        ),
+        real,
+        rel_tol=1e-3,
+    )
 
 
 _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS = [
@@ -84,19 +104,30 @@ _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS = [
     # > increment DRATE_E and use DRATE_M = 0.
     (0, 13, 203124),
 ]
+_SYMBOL_RATE_MANTISSA_EXPONENT_IDS = [
+    f"m{m}e{e}" for m, e, _ in _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS
+]
 
 
 @pytest.mark.parametrize(
-    ("mantissa", "exponent", "real"), _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS
+    ("mantissa", "exponent", "real"),
+    _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS,
+    ids=_SYMBOL_RATE_MANTISSA_EXPONENT_IDS,
 )
 def test__symbol_rate_floating_point_to_real(mantissa, exponent, real):
-    assert cc1101.CC1101._symbol_rate_floating_point_to_real(
-        mantissa=mantissa, exponent=exponent
-    ) == pytest.approx(real, rel=1e-5)
+    assert math.isclose(
+        cc1101.CC1101._symbol_rate_floating_point_to_real(
+            mantissa=mantissa, exponent=exponent
+        ),
+        real,
+        rel_tol=1e-5,
+    )
 
 
 @pytest.mark.parametrize(
-    ("mantissa", "exponent", "real"), _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS
+    ("mantissa", "exponent", "real"),
+    _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS,
+    ids=_SYMBOL_RATE_MANTISSA_EXPONENT_IDS,
 )
 def test__symbol_rate_real_to_floating_point(mantissa, exponent, real):
     assert cc1101.CC1101._symbol_rate_real_to_floating_point(real) == (
@@ -106,27 +137,27 @@ def test__symbol_rate_real_to_floating_point(mantissa, exponent, real):
 
 
 @pytest.mark.parametrize(
-    ("mantissa", "exponent", "real"), _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS
+    ("mantissa", "exponent", "real"),
+    _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS,
+    ids=_SYMBOL_RATE_MANTISSA_EXPONENT_IDS,
 )
-def test_get_symbol_rate_baud(transceiver, mantissa, exponent, real):
-    with unittest.mock.patch.object(
-        transceiver, "_get_symbol_rate_mantissa", return_value=mantissa
-    ), unittest.mock.patch.object(
-        transceiver, "_get_symbol_rate_exponent", return_value=exponent
-    ):
-        assert transceiver.get_symbol_rate_baud() == pytest.approx(real, rel=1e-5)
+def test_get_symbol_rate_baud(monkeypatch, transceiver, mantissa, exponent, real):
+    monkeypatch.setattr(transceiver, "_get_symbol_rate_mantissa", lambda: mantissa)
+    monkeypatch.setattr(transceiver, "_get_symbol_rate_exponent", lambda: exponent)
+    assert math.isclose(transceiver.get_symbol_rate_baud(), real, rel_tol=1e-5)
 
 
 @pytest.mark.parametrize(
-    ("mantissa", "exponent", "real"), _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS
+    ("mantissa", "exponent", "real"),
+    _SYMBOL_RATE_MANTISSA_EXPONENT_REAL_PARAMS,
+    ids=_SYMBOL_RATE_MANTISSA_EXPONENT_IDS,
 )
-def test_set_symbol_rate_baud(transceiver, mantissa, exponent, real):
-    with unittest.mock.patch.object(
-        transceiver, "_set_symbol_rate_mantissa"
-    ) as set_mantissa_mock, unittest.mock.patch.object(
-        transceiver, "_set_symbol_rate_exponent"
-    ) as set_exponent_mock:
-        transceiver.set_symbol_rate_baud(real)
+def test_set_symbol_rate_baud(monkeypatch, transceiver, mantissa, exponent, real):
+    set_mantissa_mock = unittest.mock.Mock()
+    monkeypatch.setattr(transceiver, "_set_symbol_rate_mantissa", set_mantissa_mock)
+    set_exponent_mock = unittest.mock.Mock()
+    monkeypatch.setattr(transceiver, "_set_symbol_rate_exponent", set_exponent_mock)
+    transceiver.set_symbol_rate_baud(real)
     set_mantissa_mock.assert_called_once_with(mantissa)
     set_exponent_mock.assert_called_once_with(exponent)
 
@@ -141,21 +172,20 @@ def test_set_symbol_rate_baud(transceiver, mantissa, exponent, real):
         (433.92e6, False),
     ),
 )
-def test_set_base_frequency_hertz_low_warning(transceiver, freq_hz, warn):
+def test_set_base_frequency_hertz_low_warning(recwarn, transceiver, freq_hz, warn):
     with unittest.mock.patch.object(
         transceiver, "_set_base_frequency_control_word"
     ) as set_control_word_mock:
-        with warnings.catch_warnings(record=True) as caught_warnings:
-            transceiver.set_base_frequency_hertz(freq_hz)
+        transceiver.set_base_frequency_hertz(freq_hz)
     set_control_word_mock.assert_called_once()
     if warn:
-        assert len(caught_warnings) == 1
+        assert len(recwarn.list) == 1
         assert (
-            str(caught_warnings[0].message)
+            str(recwarn.list[0].message)
             == "CC1101 is unable to transmit at frequencies below 281.7 MHz"
         )
     else:
-        assert not caught_warnings
+        assert not recwarn.list
 
 
 @pytest.mark.parametrize(
@@ -166,35 +196,38 @@ def test_set_base_frequency_hertz_low_warning(transceiver, freq_hz, warn):
         ((0, 198, 0, 0, 0, 0, 0, 0), 1, (0, 198)),
         ((0, 1, 2, 3, 4, 5, 21, 42), 7, (0, 1, 2, 3, 4, 5, 21, 42)),
     ),
+    ids=["cc1101-default", "library-default", "shifted", "full"],
 )
-def test_get_output_power(transceiver, patable, patable_index, power_levels):
-    with unittest.mock.patch.object(
-        transceiver, "_get_patable", return_value=patable
-    ), unittest.mock.patch.object(
-        transceiver, "_get_power_amplifier_setting_index", return_value=patable_index
-    ):
-        assert transceiver.get_output_power() == power_levels
+def test_get_output_power(
+    monkeypatch, transceiver, patable, patable_index, power_levels
+):
+    monkeypatch.setattr(transceiver, "_get_patable", lambda: patable)
+    monkeypatch.setattr(
+        transceiver, "_get_power_amplifier_setting_index", lambda: patable_index
+    )
+    assert transceiver.get_output_power() == power_levels
 
 
 @pytest.mark.parametrize(
-    ("patable_index", "power_levels"),
+    ("patable_index", "power_levels", "patable"),
     (
-        (0, (198,)),  # CC1101's default
-        (1, (198, 0)),  # library's default
-        (1, (0, 198)),
-        (1, [0, 198]),
-        (1, b"\0\x6c"),
-        (7, (0, 1, 2, 3, 4, 5, 21, 42)),
+        (0, (198,), [198]),  # CC1101's default
+        (1, (198, 0), [198, 0]),  # library's default
+        (1, (0, 198), [0, 198]),
+        (1, [0, 198], [0, 198]),
+        (1, b"\0\x6c", [0, 0x6C]),
+        (7, (0, 1, 2, 3, 4, 5, 21, 42), [0, 1, 2, 3, 4, 5, 21, 42]),
     ),
+    ids=["cc1101-default", "library-default", "tuple", "list", "bytes", "full"],
 )
-def test_set_output_power(transceiver, patable_index, power_levels):
+def test_set_output_power(transceiver, patable_index, power_levels, patable):
     with unittest.mock.patch.object(
         transceiver, "_set_patable"
     ) as set_patable_mock, unittest.mock.patch.object(
         transceiver, "_set_power_amplifier_setting_index"
     ) as set_patable_index_mock:
         transceiver.set_output_power(power_levels)
-    set_patable_mock.assert_called_once_with(list(power_levels))
+    set_patable_mock.assert_called_once_with(patable)
     set_patable_index_mock.assert_called_once_with(patable_index)
 
 
@@ -204,3 +237,84 @@ def test_set_output_power(transceiver, patable_index, power_levels):
 def test_set_output_power_invalid(transceiver, power_levels):
     with pytest.raises(Exception):
         transceiver.set_output_power(power_levels)
+
+
+# see "Table 43: Configuration Registers Overview", column "Reset value",
+# preceded by the chip status byte
+_DEFAULT_REGISTER_DUMP = bytes.fromhex(
+    "00"  # chip status byte
+    " 29 2E 3F 07 D3 91 FF 04"  # IOCFG2 - PKTCTRL1
+    " 45 00 00 0F 00 1E C4 EC"  # PKTCTRL0 - FREQ0
+    " 8C 22 02 22 F8 47 07 30"  # MDMCFG4 - MCSM1
+    " 04 36 6C 03 40 91 87 6B"  # MCSM0 - WOREVT0
+    " F8 56 10 A9 0A 20 0D 41"  # WORCTRL - RCCTRL1
+    " 00 59 7F 3F 88 31 0B"  # RCCTRL0 - TEST0
+)
+
+
+def test_get_configuration_register_values_defaults(transceiver):
+    transceiver._spi.xfer.return_value = list(_DEFAULT_REGISTER_DUMP)
+    assert transceiver.get_configuration_register_values() == {
+        ConfigurationRegisterAddress.IOCFG2: 0x29,
+        ConfigurationRegisterAddress.IOCFG1: 0x2E,
+        ConfigurationRegisterAddress.IOCFG0: 0x3F,
+        ConfigurationRegisterAddress.FIFOTHR: 0x07,
+        ConfigurationRegisterAddress.SYNC1: 0xD3,
+        ConfigurationRegisterAddress.SYNC0: 0x91,
+        ConfigurationRegisterAddress.PKTLEN: 0xFF,
+        ConfigurationRegisterAddress.PKTCTRL1: 0x04,
+        ConfigurationRegisterAddress.PKTCTRL0: 0x45,
+        ConfigurationRegisterAddress.ADDR: 0x00,
+        ConfigurationRegisterAddress.CHANNR: 0x00,
+        ConfigurationRegisterAddress.FSCTRL1: 0x0F,
+        ConfigurationRegisterAddress.FSCTRL0: 0x00,
+        ConfigurationRegisterAddress.FREQ2: 0x1E,
+        ConfigurationRegisterAddress.FREQ1: 0xC4,
+        ConfigurationRegisterAddress.FREQ0: 0xEC,
+        ConfigurationRegisterAddress.MDMCFG4: 0x8C,
+        ConfigurationRegisterAddress.MDMCFG3: 0x22,
+        ConfigurationRegisterAddress.MDMCFG2: 0x02,
+        ConfigurationRegisterAddress.MDMCFG1: 0x22,
+        ConfigurationRegisterAddress.MDMCFG0: 0xF8,
+        ConfigurationRegisterAddress.DEVIATN: 0x47,
+        ConfigurationRegisterAddress.MCSM2: 0x07,
+        ConfigurationRegisterAddress.MCSM1: 0x30,
+        ConfigurationRegisterAddress.MCSM0: 0x04,
+        ConfigurationRegisterAddress.FOCCFG: 0x36,
+        ConfigurationRegisterAddress.BSCFG: 0x6C,
+        ConfigurationRegisterAddress.AGCTRL2: 0x03,
+        ConfigurationRegisterAddress.AGCTRL1: 0x40,
+        ConfigurationRegisterAddress.AGCTRL0: 0x91,
+        ConfigurationRegisterAddress.WOREVT1: 0x87,
+        ConfigurationRegisterAddress.WOREVT0: 0x6B,
+        ConfigurationRegisterAddress.WORCTRL: 0xF8,
+        ConfigurationRegisterAddress.FREND1: 0x56,
+        ConfigurationRegisterAddress.FREND0: 0x10,
+        ConfigurationRegisterAddress.FSCAL3: 0xA9,
+        ConfigurationRegisterAddress.FSCAL2: 0x0A,
+        ConfigurationRegisterAddress.FSCAL1: 0x20,
+        ConfigurationRegisterAddress.FSCAL0: 0x0D,
+        ConfigurationRegisterAddress.RCCTRL1: 0x41,
+        ConfigurationRegisterAddress.RCCTRL0: 0x00,
+        ConfigurationRegisterAddress.FSTEST: 0x59,
+        ConfigurationRegisterAddress.PTEST: 0x7F,
+        ConfigurationRegisterAddress.AGCTEST: 0x3F,
+        ConfigurationRegisterAddress.TEST2: 0x88,
+        ConfigurationRegisterAddress.TEST1: 0x31,
+        ConfigurationRegisterAddress.TEST0: 0x0B,
+    }
+    transceiver._spi.xfer.assert_called_once_with([0x00 | 0xC0] + [0] * 47)
+
+
+def test_get_configuration_register_values(transceiver):
+    transceiver._spi.xfer.return_value = [0, 0x8C, 0x22, 0x02, 0x22]
+    assert transceiver.get_configuration_register_values(
+        start_register=ConfigurationRegisterAddress.MDMCFG4,
+        end_register=ConfigurationRegisterAddress.MDMCFG1,
+    ) == {
+        ConfigurationRegisterAddress.MDMCFG4: 0x8C,
+        ConfigurationRegisterAddress.MDMCFG3: 0x22,
+        ConfigurationRegisterAddress.MDMCFG2: 0x02,
+        ConfigurationRegisterAddress.MDMCFG1: 0x22,
+    }
+    transceiver._spi.xfer.assert_called_once_with([0x10 | 0xC0] + [0] * 4)